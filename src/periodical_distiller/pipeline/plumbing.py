@@ -13,15 +13,24 @@ This module provides the core abstractions for the pipeline:
 
 import json
 import logging
+import os
 import signal
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from time import sleep
-from typing import Optional
+from typing import Any, Optional
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Token file suffix -> Pipeline.snapshot key for tokens in that state.
+_STATE_BY_SUFFIX = {
+    ".json": "waiting_tokens",
+    ".err": "errored_tokens",
+    ".bak": "in_process_tokens",
+}
+
 
 class Token:
     """
@@ -36,16 +45,30 @@ class Token:
                        processing history, and stage-specific data.
     """
 
+    __slots__ = ("content",)
+
     def __init__(self, content: dict):
         self.content = content
 
     def __repr__(self) -> str:
         return f"Token({self.name})"
 
+    def __getitem__(self, prop: str) -> Any:
+        return self.content[prop]
+
+    def __setitem__(self, prop: str, val: Any) -> None:
+        self.content[prop] = val
+
+    def __contains__(self, prop: str) -> bool:
+        return prop in self.content
+
+    # Not iterable: stops __getitem__ from enabling the legacy sequence protocol
+    __iter__ = None
+
     def get_prop(self, prop: str) -> str | None:
         return self.content.get(prop)
 
-    def put_prop(self, prop: str, val) -> None:
+    def put_prop(self, prop: str, val: Any) -> None:
         self.content[prop] = val
 
     @property
@@ -78,20 +101,49 @@ def load_token(token_file: Path) -> Token:
     Returns:
         The loaded token instance
     """
-    with token_file.open("r") as f:
-        token_info = json.load(f)
-        return Token(token_info)
+    return Token(json.loads(token_file.read_bytes()))
 
 
 def dump_token(token: Token, destination: Path) -> None:
     """Save a token to a JSON file.
 
+    The JSON is written to a hidden temporary file beside the destination and
+    then renamed over it, so a crash mid-write never leaves a truncated token
+    for the next stage to pick up.
+
     Args:
         token: The token to save
         destination: Path where the token file should be written
     """
-    with destination.open("w+") as f:
-        json.dump(token.content, fp=f, indent=2)
+    tmp_path = destination.with_name(f".{destination.name}.tmp")
+    try:
+        tmp_path.write_bytes(json.dumps(token.content, indent=2).encode())
+        os.replace(tmp_path, destination)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _scan_bucket(location: Path) -> dict[str, list[str]]:
+    """Sort a bucket's token files by state in a single directory read.
+
+    Args:
+        location: Bucket directory to scan
+
+    Returns:
+        Dictionary with waiting (.json), errored (.err) and in-process (.bak)
+        token file names. A missing bucket reads as empty.
+    """
+    scan: dict[str, list[str]] = {state: [] for state in _STATE_BY_SUFFIX.values()}
+    try:
+        with os.scandir(location) as entries:
+            for entry in entries:
+                state = _STATE_BY_SUFFIX.get(os.path.splitext(entry.name)[1])
+                if state is not None and entry.is_file():
+                    scan[state].append(entry.name)
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return scan
 
 
 class Pipe:
@@ -118,25 +170,25 @@ class Pipe:
 
     def in_path(self, token: Token) -> Path:
         if token is not None and token.name is not None:
-            return self.input / Path(token.name).with_suffix(".json")
+            return self.input / f"{token.name}.json"
         else:
             raise ValueError("no token or token name")
 
     def out_path(self, token: Token) -> Path:
         if token is not None and token.name is not None:
-            return self.output / Path(token.name).with_suffix(".json")
+            return self.output / f"{token.name}.json"
         else:
             raise ValueError("no token or token name")
 
     def marked_path(self, token: Token) -> Path:
         if token is not None and token.name is not None:
-            return self.input / Path(token.name).with_suffix(".bak")
+            return self.input / f"{token.name}.bak"
         else:
             raise ValueError("no token or token name")
 
     def error_path(self, token: Token) -> Path:
         if token is not None and token.name is not None:
-            return self.input / Path(token.name).with_suffix(".err")
+            return self.input / f"{token.name}.err"
         else:
             raise ValueError("no token or token name")
 
@@ -170,10 +222,8 @@ class Pipe:
 
     def list_input_tokens(self) -> list[Token]:
         """List all available tokens in the input bucket."""
-        all_tokens = []
-        for f in self.input.glob("*.json"):
-            all_tokens.append(load_token(f))
-        return all_tokens
+        waiting = _scan_bucket(self.input)["waiting_tokens"]
+        return [load_token(self.input / name) for name in waiting]
 
     def take_token(self, id: str | None = None) -> Token | None:
         """Take the next available token from the input bucket.
@@ -207,7 +257,7 @@ class Pipe:
                 return None
         else:
             try:
-                token_path = self.input / Path(id).with_suffix(".json")
+                token_path = self.input / f"{id}.json"
                 self.token = load_token(token_path)
                 self.mark_token()  # Rename to .bak to prevent concurrent access
                 return self.token
@@ -220,11 +270,11 @@ class Pipe:
         if self.token and self.token.name:
             unmarked_path: Path = self.in_path(self.token)
             marked_path: Path = self.marked_path(self.token)
-            if unmarked_path.is_file():
+            try:
                 # Rename .json to .bak to signal it's being processed
                 unmarked_path.rename(marked_path)
-            else:
-                raise FileNotFoundError(f"{unmarked_path} does not exist")
+            except FileNotFoundError:
+                raise FileNotFoundError(f"{unmarked_path} does not exist") from None
 
     def delete_marked_token(self) -> None:
         """Delete the marked (.bak) file for the current token."""
@@ -316,7 +366,8 @@ class Filter(ABC):
         state. This method converts them back to .json so they can be
         reprocessed on the next run.
         """
-        for bak_file in self.pipe.input.glob("*.bak"):
+        for name in _scan_bucket(self.pipe.input)["in_process_tokens"]:
+            bak_file = self.pipe.input / name
             json_file = bak_file.with_suffix(".json")
             logger.warning(
                 f"{self.stage_name}: Recovering orphaned token: {bak_file.name} -> {json_file.name}"
@@ -467,12 +518,12 @@ class Pipeline:
             waiting tokens (.json), errored tokens (.err), and tokens
             currently being processed (.bak)
         """
-        buckets = {}
-        for name, location in self.buckets.items():
-            info = {
-                "waiting_tokens": [f.name for f in Path(location).glob("*.json")],
-                "errored_tokens": [f.name for f in Path(location).glob("*.err")],
-                "in_process_tokens": [f.name for f in Path(location).glob("*.bak")],
-            }
-            buckets[name] = info
-        return buckets
+        locations = [Path(location) for location in self.buckets.values()]
+        if len(locations) <= 1:
+            scans = [_scan_bucket(location) for location in locations]
+        else:
+            # Directory reads release the GIL, so buckets on slow or shared
+            # filesystems are scanned concurrently rather than one by one.
+            with ThreadPoolExecutor(max_workers=min(32, len(locations))) as executor:
+                scans = list(executor.map(_scan_bucket, locations))
+        return dict(zip(self.buckets, scans))
@@ -1,12 +1,30 @@
-"""Transformers for converting data between formats."""
+"""Transformers for converting data between formats.
+
+The concrete transformers are imported on first access so that importing the
+base classes (as every pipeline filter does) does not pull in WeasyPrint,
+PyMuPDF and the other rendering dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .alto_transformer import ALTOTransformer
-from .html_transformer import HTMLTransformer
-from .image_transformer import ImageTransformer
-from .mods_transformer import MODSTransformer
-from .pdf_transformer import PDFTransformer
 from .transformer import PIPTransformer, SIPTransformer, Transformer
 
+if TYPE_CHECKING:
+    from .alto_transformer import ALTOTransformer
+    from .html_transformer import HTMLTransformer
+    from .image_transformer import ImageTransformer
+    from .mods_transformer import MODSTransformer
+    from .pdf_transformer import PDFTransformer
+
+_LAZY_TRANSFORMERS = {
+    "HTMLTransformer": ".html_transformer",
+    "PDFTransformer": ".pdf_transformer",
+    "ALTOTransformer": ".alto_transformer",
+    "MODSTransformer": ".mods_transformer",
+    "ImageTransformer": ".image_transformer",
+}
+
 __all__ = [
     "PIPTransformer",
     "SIPTransformer",
@@ -17,3 +35,12 @@ __all__ = [
     "MODSTransformer",
     "ImageTransformer",
 ]
+
+
+def __getattr__(name: str) -> type:
+    module_name = _LAZY_TRANSFORMERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: type = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
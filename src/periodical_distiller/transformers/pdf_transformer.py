@@ -135,10 +135,7 @@ class PDFTransformer(SIPTransformer):
 
         base_url = self.base_url or article_dir.resolve().as_uri() + "/"
 
-        html_doc = HTML(filename=str(html_path), base_url=base_url)
-
-        stylesheets = [css] if css else None
-        html_doc.write_pdf(str(pdf_path), stylesheets=stylesheets)
+        self._render_pdf(html_path, pdf_path, base_url, css)
 
         logger.debug(f"Generated PDF for article {ceo_id}")
 
@@ -155,6 +152,20 @@ class PDFTransformer(SIPTransformer):
 
         logger.debug(f"Article {ceo_id} has {page_count} pages")
 
+    def _render_pdf(self, html_path: Path, pdf_path: Path, base_url: str, css: CSS | None) -> None:
+        """Render an HTML file to PDF using WeasyPrint.
+
+        Args:
+            html_path: Path to the source HTML file
+            pdf_path: Path where the PDF should be written
+            base_url: Base URL for resolving relative paths in the HTML
+            css: WeasyPrint CSS object for styling
+        """
+        html_doc = HTML(filename=str(html_path), base_url=base_url)
+
+        stylesheets = [css] if css else None
+        html_doc.write_pdf(str(pdf_path), stylesheets=stylesheets)
+
     def _count_pages(self, pdf_path: Path) -> int:
         """Count the number of pages in a PDF file.
 
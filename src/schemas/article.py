@@ -6,7 +6,7 @@ from pathlib import Path
 from lxml import etree
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents a single article from the source publication.
 
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class Page:
     """Represents Veridian's view of a page within the assembled issue.
 
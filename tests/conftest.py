@@ -21,12 +21,12 @@ def tmp_buckets(tmp_path):
     return buckets
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ceo_record():
     """Sample CEO3 record for testing.
 
     This matches the structure returned by the CEO3 API with properly
-    typed nested objects.
+    typed nested objects. Session-scoped: tests must copy before modifying.
     """
     return {
         "id": "12345",
@@ -102,6 +102,12 @@ def sample_ceo_record():
     }
 
 
+@pytest.fixture(scope="session")
+def sample_ceo_record_bytes(sample_ceo_record):
+    """sample_ceo_record encoded once as JSON bytes, for writing ceo_record.json."""
+    return json.dumps(sample_ceo_record).encode()
+
+
 @pytest.fixture
 def sample_article_token_content(sample_ceo_record):
     """Sample article token content for pipeline testing."""
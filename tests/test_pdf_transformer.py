@@ -1,25 +1,54 @@
 """Tests for the PDF Transformer."""
 
 import json
+import struct
+import zlib
 from pathlib import Path
 
 import pytest
+from weasyprint import CSS
 
 from periodical_distiller.transformers.pdf_transformer import PDFTransformer
 from schemas.sip import SIPArticle, SIPManifest
 
+# Sealed, empty manifest; tests derive variants with model_copy(update=...)
+_BASE_MANIFEST = SIPManifest(id="base", pip_id="base", articles=[], status="sealed")
+
+# Minimal one-page PDF written in place of a WeasyPrint render
+_STUB_PDF = (
+    b"%PDF-1.4\n"
+    b"1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+    b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+    b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 612 792]>>endobj\n"
+    b"trailer<</Root 1 0 R>>\n"
+    b"%%EOF\n"
+)
+
+
+@pytest.fixture
+def fast_render(monkeypatch):
+    """Replace WeasyPrint rendering with a pre-rendered stub PDF.
+
+    For tests that check manifest updates and file placement rather than
+    rendering output. Yields the list of stylesheets passed to each render.
+    """
+    rendered_css = []
+
+    def render(self, html_path, pdf_path, base_url, css):
+        rendered_css.append(css)
+        pdf_path.write_bytes(_STUB_PDF)
+
+    monkeypatch.setattr(PDFTransformer, "_render_pdf", render)
+    yield rendered_css
+
 
 @pytest.fixture
 def sample_sip_structure(tmp_path):
     """Create a sample SIP directory structure for testing."""
     sip_dir = tmp_path / "sips" / "2026-01-29"
-    sip_dir.mkdir(parents=True)
-
     article_dir = sip_dir / "articles" / "12345"
-    article_dir.mkdir(parents=True)
-
     images_dir = article_dir / "images"
-    images_dir.mkdir()
+    images_dir.mkdir(parents=True)
 
     test_image = images_dir / "test-image.jpg"
     # Create a minimal valid JPEG (1x1 pixel)
@@ -436,17 +465,11 @@ h1 { font-size: 24pt; }
 def sample_sip_with_image(tmp_path):
     """Create a SIP with an HTML file that includes an image."""
     sip_dir = tmp_path / "sips" / "2026-01-30"
-    sip_dir.mkdir(parents=True)
-
     article_dir = sip_dir / "articles" / "67890"
-    article_dir.mkdir(parents=True)
-
     images_dir = article_dir / "images"
-    images_dir.mkdir()
+    images_dir.mkdir(parents=True)
 
     # Create a minimal valid 1x1 red PNG using proper zlib compression
-    import zlib
-
     # IHDR chunk data: 1x1, 8-bit RGB
     ihdr_data = b"\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00"
 
@@ -455,8 +478,6 @@ def sample_sip_with_image(tmp_path):
     compressed = zlib.compress(raw_data)
 
     def make_chunk(chunk_type: bytes, data: bytes) -> bytes:
-        import struct
-
         length = struct.pack(">I", len(data))
         crc = zlib.crc32(chunk_type + data) & 0xFFFFFFFF
         crc_bytes = struct.pack(">I", crc)
@@ -531,7 +552,6 @@ body {
 def sample_sip_multiple_articles(tmp_path):
     """Create a SIP with multiple articles."""
     sip_dir = tmp_path / "sips" / "2026-01-31"
-    sip_dir.mkdir(parents=True)
 
     for ceo_id, title in [("11111", "First Article"), ("22222", "Second Article")]:
         article_dir = sip_dir / "articles" / ceo_id
@@ -572,6 +592,23 @@ def sample_sip_multiple_articles(tmp_path):
     return sip_dir
 
 
+def _make_single_article_sip(tmp_path: Path, html_path: str | None) -> Path:
+    """Write a sealed SIP whose single article (99999) has no HTML file on disk."""
+    sip_dir = tmp_path / "sips" / "99999"
+    (sip_dir / "articles" / "99999").mkdir(parents=True)
+
+    manifest = _BASE_MANIFEST.model_copy(
+        update={
+            "id": "99999",
+            "pip_id": "99999",
+            "articles": [SIPArticle(ceo_id="99999", html_path=html_path)],
+        }
+    )
+    (sip_dir / "sip-manifest.json").write_text(manifest.model_dump_json(indent=2))
+
+    return sip_dir
+
+
 class TestPDFTransformerInit:
     """Tests for PDFTransformer initialization."""
 
@@ -600,6 +637,7 @@ class TestPDFTransformerInit:
 class TestPDFTransformerTransform:
     """Tests for PDFTransformer.transform() method."""
 
+    @pytest.mark.usefixtures("fast_render")
     def test_transform_creates_pdf_file(self, sample_sip_structure):
         """transform() generates a PDF file for each article."""
         transformer = PDFTransformer()
@@ -608,6 +646,7 @@ class TestPDFTransformerTransform:
         pdf_path = sample_sip_structure / "articles" / "12345" / "article.pdf"
         assert pdf_path.exists()
 
+    @pytest.mark.slow
     def test_transform_creates_valid_pdf(self, sample_sip_structure):
         """transform() creates a valid PDF file."""
         transformer = PDFTransformer()
@@ -619,6 +658,7 @@ class TestPDFTransformerTransform:
         # Check PDF magic bytes
         assert content[:4] == b"%PDF"
 
+    @pytest.mark.usefixtures("fast_render")
     def test_transform_returns_sip_manifest(self, sample_sip_structure):
         """transform() returns a SIPManifest."""
         transformer = PDFTransformer()
@@ -627,6 +667,7 @@ class TestPDFTransformerTransform:
         assert isinstance(manifest, SIPManifest)
         assert manifest.id == "2026-01-29"
 
+    @pytest.mark.usefixtures("fast_render")
     def test_transform_updates_pdf_path(self, sample_sip_structure):
         """transform() updates article.pdf_path in manifest."""
         transformer = PDFTransformer()
@@ -634,6 +675,7 @@ class TestPDFTransformerTransform:
 
         assert manifest.articles[0].pdf_path == "articles/12345/article.pdf"
 
+    @pytest.mark.usefixtures("fast_render")
     def test_transform_writes_updated_manifest(self, sample_sip_structure):
         """transform() writes the updated manifest to disk."""
         transformer = PDFTransformer()
@@ -644,6 +686,7 @@ class TestPDFTransformerTransform:
 
         assert data["articles"][0]["pdf_path"] == "articles/12345/article.pdf"
 
+    @pytest.mark.usefixtures("fast_render")
     def test_transform_multiple_articles(self, sample_sip_multiple_articles):
         """transform() generates PDFs for all articles."""
         transformer = PDFTransformer()
@@ -657,6 +700,7 @@ class TestPDFTransformerTransform:
             assert pdf_path.exists()
 
 
+@pytest.mark.slow
 class TestPDFTransformerPageCounting:
     """Tests for PDF page counting."""
 
@@ -701,6 +745,7 @@ class TestPDFTransformerPageCounting:
         assert isinstance(page_count, int)
 
 
+@pytest.mark.slow
 class TestPDFTransformerImageHandling:
     """Tests for handling images in HTML."""
 
@@ -722,61 +767,29 @@ class TestPDFTransformerImageHandling:
 class TestPDFTransformerErrorHandling:
     """Tests for PDFTransformer error handling."""
 
-    def test_transform_skips_article_without_html_path(self, tmp_path):
-        """transform() skips articles without html_path."""
-        sip_dir = tmp_path / "sips" / "no-html"
-        sip_dir.mkdir(parents=True)
-
-        manifest = SIPManifest(
-            id="no-html",
-            pip_id="no-html",
-            articles=[
-                SIPArticle(ceo_id="99999", html_path=None),
-            ],
-            status="sealed",
-        )
-        manifest_path = sip_dir / "sip-manifest.json"
-        manifest_path.write_text(manifest.model_dump_json(indent=2))
+    @pytest.mark.parametrize(
+        "html_path,expect_error",
+        [(None, False), ("articles/99999/article.html", True)],
+        ids=["no-html-path", "missing-html-file"],
+    )
+    def test_transform_handles_article_without_html(self, tmp_path, html_path, expect_error):
+        """transform() skips articles without html_path and records an error for missing HTML."""
+        sip_dir = _make_single_article_sip(tmp_path, html_path)
 
         transformer = PDFTransformer()
         result = transformer.transform(sip_dir)
 
-        # Should not have pdf_path set
         assert result.articles[0].pdf_path is None
-        assert len(result.validation_errors) == 0
-
-    def test_transform_records_error_for_missing_html(self, tmp_path):
-        """transform() records error when HTML file is missing."""
-        sip_dir = tmp_path / "sips" / "missing-html"
-        sip_dir.mkdir(parents=True)
-
-        article_dir = sip_dir / "articles" / "99999"
-        article_dir.mkdir(parents=True)
-
-        manifest = SIPManifest(
-            id="missing-html",
-            pip_id="missing-html",
-            articles=[
-                SIPArticle(
-                    ceo_id="99999",
-                    html_path="articles/99999/article.html",  # File doesn't exist
-                ),
-            ],
-            status="sealed",
-        )
-        manifest_path = sip_dir / "sip-manifest.json"
-        manifest_path.write_text(manifest.model_dump_json(indent=2))
-
-        transformer = PDFTransformer()
-        result = transformer.transform(sip_dir)
-
-        assert len(result.validation_errors) == 1
-        assert "99999" in result.validation_errors[0]
+        if expect_error:
+            assert len(result.validation_errors) == 1
+            assert "99999" in result.validation_errors[0]
+        else:
+            assert len(result.validation_errors) == 0
 
+    @pytest.mark.slow
     def test_transform_continues_after_error(self, tmp_path):
         """transform() continues processing after an article error."""
         sip_dir = tmp_path / "sips" / "partial"
-        sip_dir.mkdir(parents=True)
 
         # First article: missing HTML
         missing_dir = sip_dir / "articles" / "missing"
@@ -793,20 +806,21 @@ class TestPDFTransformerErrorHandling:
 </html>"""
         (valid_dir / "article.html").write_text(html_content)
 
-        manifest = SIPManifest(
-            id="partial",
-            pip_id="partial",
-            articles=[
-                SIPArticle(
-                    ceo_id="missing",
-                    html_path="articles/missing/article.html",
-                ),
-                SIPArticle(
-                    ceo_id="valid",
-                    html_path="articles/valid/article.html",
-                ),
-            ],
-            status="sealed",
+        manifest = _BASE_MANIFEST.model_copy(
+            update={
+                "id": "partial",
+                "pip_id": "partial",
+                "articles": [
+                    SIPArticle(
+                        ceo_id="missing",
+                        html_path="articles/missing/article.html",
+                    ),
+                    SIPArticle(
+                        ceo_id="valid",
+                        html_path="articles/valid/article.html",
+                    ),
+                ],
+            }
         )
         manifest_path = sip_dir / "sip-manifest.json"
         manifest_path.write_text(manifest.model_dump_json(indent=2))
@@ -826,6 +840,7 @@ class TestPDFTransformerErrorHandling:
 class TestPDFTransformerRelativePath:
     """Regression test: base_url must be well-formed when sip_path is relative."""
 
+    @pytest.mark.slow
     def test_transform_with_relative_sip_path_produces_valid_pdf(self, tmp_path, monkeypatch):
         """transform() succeeds and generates a valid PDF when invoked with a relative sip_path.
 
@@ -837,8 +852,6 @@ class TestPDFTransformerRelativePath:
         """
         # Build a real SIP under tmp_path
         sip_dir = tmp_path / "sips" / "2026-02-19"
-        sip_dir.mkdir(parents=True)
-
         article_dir = sip_dir / "articles" / "55555"
         article_dir.mkdir(parents=True)
 
@@ -887,20 +900,19 @@ class TestPDFTransformerRelativePath:
 class TestPDFTransformerStylesheet:
     """Tests for stylesheet loading."""
 
-    def test_transform_uses_sip_stylesheet(self, sample_sip_structure):
+    def test_transform_uses_sip_stylesheet(self, sample_sip_structure, fast_render):
         """transform() uses stylesheet from SIP directory."""
         transformer = PDFTransformer()
         transformer.transform(sample_sip_structure)
 
-        # If it completes without error, the stylesheet was used
+        assert len(fast_render) == 1
+        assert isinstance(fast_render[0], CSS)
         pdf_path = sample_sip_structure / "articles" / "12345" / "article.pdf"
         assert pdf_path.exists()
 
-    def test_transform_works_without_stylesheet(self, tmp_path):
+    def test_transform_works_without_stylesheet(self, tmp_path, fast_render):
         """transform() works even without a stylesheet."""
         sip_dir = tmp_path / "sips" / "no-css"
-        sip_dir.mkdir(parents=True)
-
         article_dir = sip_dir / "articles" / "12345"
         article_dir.mkdir(parents=True)
 
@@ -925,6 +937,7 @@ class TestPDFTransformerStylesheet:
         transformer = PDFTransformer(stylesheet_name="nonexistent.css")
         manifest = transformer.transform(sip_dir)
 
+        assert fast_render == [None]
         assert manifest.articles[0].pdf_path is not None
         pdf_path = sip_dir / "articles" / "12345" / "article.pdf"
         assert pdf_path.exists()
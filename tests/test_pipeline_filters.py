@@ -1,8 +1,8 @@
 """Tests for pipeline filter implementations and the Orchestrator."""
 
 import json
+import os
 from pathlib import Path
-from unittest.mock import MagicMock
 
 import pytest
 
@@ -12,7 +12,6 @@ from periodical_distiller.pipeline.filters.image_filter import ImageFilter
 from periodical_distiller.pipeline.filters.mets_filter import MetsFilter
 from periodical_distiller.pipeline.filters.mods_filter import ModsFilter
 from periodical_distiller.pipeline.filters.pdf_filter import PdfFilter
-from periodical_distiller.pipeline.orchestrator import Orchestrator
 from periodical_distiller.pipeline.plumbing import Pipe, Token
 from schemas.pip import PIPArticle, PIPManifest
 from schemas.sip import SIPArticle, SIPManifest
@@ -22,175 +21,235 @@ from schemas.sip import SIPArticle, SIPManifest
 # ---------------------------------------------------------------------------
 
 
-def _make_manifest(ceo_id: str = "12345", mets_path: str | None = None) -> SIPManifest:
-    """Build a minimal SIPManifest for use in mock returns."""
-    return SIPManifest(
-        id="2026-01-29",
-        pip_id="2026-01-29",
-        mets_path=mets_path,
-        articles=[SIPArticle(ceo_id=ceo_id)],
-    )
+# Minimal SIPManifest returned by mock transformers, built from known-good data
+# without validation. Shared by every test, so never mutate it; derive variants
+# with model_copy(update=...).
+_DEFAULT_MANIFEST = SIPManifest.model_construct(
+    id="2026-01-29",
+    pip_id="2026-01-29",
+    articles=[SIPArticle.model_construct(ceo_id="12345")],
+)
 
 
-def _seed_token(bucket: Path, token_id: str, props: dict) -> Path:
-    """Write a token JSON file to *bucket* and return the path."""
-    content = {"id": token_id, **props}
+class _StubTransformer:
+    """Stand-in for a SIPTransformer or METS compiler.
+
+    transform() and compile() return *return_value*, or raise *side_effect*
+    when it is set.
+    """
+
+    __slots__ = ("return_value", "side_effect")
+
+    def __init__(
+        self, return_value: SIPManifest | None = None, side_effect: Exception | None = None
+    ):
+        self.return_value = return_value
+        self.side_effect = side_effect
+
+    def transform(self, *args, **kwargs) -> SIPManifest | None:
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    compile = transform
+
+
+def _encode_token(token_id: str, props: dict) -> bytes:
+    """Serialize token content as compact JSON; tests only parse it back."""
+    return json.dumps({"id": token_id, **props}).encode()
+
+
+# Payloads shared by most tests, encoded once at import.
+_SIP_PATH_TOKEN = _encode_token("2026-01-29", {"sip_path": "/some/sip"})
+_EMPTY_TOKEN = _encode_token("2026-01-29", {})
+
+
+def _seed_token_bytes(bucket: Path, token_id: str, payload: bytes) -> Path:
+    """Write pre-encoded token JSON to *bucket* and return the path."""
     token_path = bucket / f"{token_id}.json"
-    token_path.write_text(json.dumps(content, indent=2))
+    token_path.write_bytes(payload)
     return token_path
 
 
+def _seed_token(bucket: Path, token_id: str, props: dict) -> Path:
+    """Write a token JSON file to *bucket* and return the path."""
+    return _seed_token_bytes(bucket, token_id, _encode_token(token_id, props))
+
+
+def _entries(bucket: Path) -> frozenset[str]:
+    """Names in *bucket*, listed with a single directory read."""
+    return frozenset(os.listdir(bucket))
+
+
+def _read_token(path: Path) -> dict:
+    """Parse a token JSON file straight from its bytes."""
+    return json.loads(path.read_bytes())
+
+
+def _make_buckets(in_name: str, out_name: str) -> tuple[Path, Path]:
+    """Create an (in, out) bucket pair under /workspace on the fake filesystem."""
+    buckets = Path("/workspace") / in_name, Path("/workspace") / out_name
+    for bucket in buckets:
+        bucket.mkdir(parents=True, exist_ok=True)
+    return buckets
+
+
+@pytest.fixture
+def pipe(buckets):
+    """Pipe between the enclosing class's in and out buckets."""
+    return Pipe(*buckets)
+
+
+@pytest.fixture
+def empty_buckets(buckets):
+    """Clear the class-scoped buckets after each test so tokens do not leak."""
+    yield
+    for bucket in buckets:
+        for entry in bucket.iterdir():
+            entry.unlink()
+
+
 # ---------------------------------------------------------------------------
 # Tests: HtmlFilter
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("empty_buckets")
 class TestHtmlFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "pip_harvested"
-        out_bucket = tmp_path / "html_transform"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_transformer(self):
-        t = MagicMock()
-        t.transform.return_value = _make_manifest()
-        return t
-
-    def test_token_advances_to_output_bucket(self, buckets, mock_transformer, tmp_path):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def buckets(cls, fs_class):
+        return _make_buckets("pip_harvested", "html_transform")
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_transformer(cls):
+        return _StubTransformer(return_value=_DEFAULT_MANIFEST)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def sip_base(cls, fs_class):
+        return Path(fs_class.create_dir("/sips").path)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def pip_path(cls, fs_class):
+        return Path(fs_class.create_dir("/pips/2026-01-29").path)
+
+    def test_token_advances_to_output_bucket(
+        self, buckets, pipe, mock_transformer, sip_base, pip_path
+    ):
         """run_once() moves token from input to output bucket."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
-        pip_path = tmp_path / "pips" / "2026-01-29"
-        pip_path.mkdir(parents=True)
 
         _seed_token(in_bucket, "2026-01-29", {"pip_path": str(pip_path)})
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=mock_transformer,
             sip_base=sip_base,
         )
         result = f.run_once()
 
         assert result is True
-        assert (out_bucket / "2026-01-29.json").exists()
+        assert _entries(out_bucket) == {"2026-01-29.json"}
 
-    def test_sets_sip_path_on_token(self, buckets, mock_transformer, tmp_path):
+    def test_sets_sip_path_on_token(self, buckets, pipe, mock_transformer, sip_base, pip_path):
         """run_once() sets sip_path prop on the token."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
-        pip_path = tmp_path / "pips" / "2026-01-29"
-        pip_path.mkdir(parents=True)
 
         _seed_token(in_bucket, "2026-01-29", {"pip_path": str(pip_path)})
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=mock_transformer,
             sip_base=sip_base,
         )
         f.run_once()
 
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert "sip_path" in token_data
         assert "2026-01-29" in token_data["sip_path"]
 
-    def test_sets_article_ids_on_token(self, buckets, mock_transformer, tmp_path):
+    def test_sets_article_ids_on_token(self, buckets, pipe, mock_transformer, sip_base, pip_path):
         """run_once() sets article_ids prop from manifest articles."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
-        pip_path = tmp_path / "pips" / "2026-01-29"
-        pip_path.mkdir(parents=True)
 
         _seed_token(in_bucket, "2026-01-29", {"pip_path": str(pip_path)})
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=mock_transformer,
             sip_base=sip_base,
         )
         f.run_once()
 
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert token_data["article_ids"] == ["12345"]
 
-    def test_validation_error_on_missing_pip_path(self, buckets, mock_transformer, tmp_path):
+    def test_validation_error_on_missing_pip_path(self, buckets, pipe, mock_transformer, sip_base):
         """run_once() sends token to .err when pip_path is missing."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
 
-        _seed_token(in_bucket, "2026-01-29", {})  # no pip_path
+        _seed_token_bytes(in_bucket, "2026-01-29", _EMPTY_TOKEN)  # no pip_path
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=mock_transformer,
             sip_base=sip_base,
         )
         result = f.run_once()
 
         assert result is False
-        assert (in_bucket / "2026-01-29.err").exists()
-        assert not (out_bucket / "2026-01-29.json").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
+        assert _entries(out_bucket) == set()
 
-    def test_transformer_exception_sends_token_to_err(self, buckets, tmp_path):
+    def test_transformer_exception_sends_token_to_err(self, buckets, pipe, sip_base, pip_path):
         """run_once() routes token to .err when transformer raises."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
-        pip_path = tmp_path / "pips" / "2026-01-29"
-        pip_path.mkdir(parents=True)
 
         _seed_token(in_bucket, "2026-01-29", {"pip_path": str(pip_path)})
 
-        bad_transformer = MagicMock()
-        bad_transformer.transform.side_effect = RuntimeError("HTML failed")
+        bad_transformer = _StubTransformer(side_effect=RuntimeError("HTML failed"))
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=bad_transformer,
             sip_base=sip_base,
         )
         result = f.run_once()
 
         assert result is False
-        assert (in_bucket / "2026-01-29.err").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
 
-    def test_validation_errors_stored_on_token(self, buckets, tmp_path):
+    def test_validation_errors_stored_on_token(self, buckets, pipe, sip_base, pip_path):
         """run_once() stores validation_errors from manifest on token."""
         in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
-        pip_path = tmp_path / "pips" / "2026-01-29"
-        pip_path.mkdir(parents=True)
 
         _seed_token(in_bucket, "2026-01-29", {"pip_path": str(pip_path)})
 
-        manifest_with_errors = _make_manifest()
-        manifest_with_errors.validation_errors = ["Article 99: some error"]
+        manifest_with_errors = _DEFAULT_MANIFEST.model_copy(
+            update={"validation_errors": ["Article 99: some error"]}
+        )
 
-        transformer = MagicMock()
-        transformer.transform.return_value = manifest_with_errors
+        transformer = _StubTransformer(return_value=manifest_with_errors)
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=transformer,
             sip_base=sip_base,
         )
         f.run_once()
 
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert "validation_errors" in token_data
         assert "Article 99: some error" in token_data["validation_errors"]
 
-    def test_no_tokens_returns_false(self, buckets, mock_transformer, tmp_path):
+    def test_no_tokens_returns_false(self, pipe, mock_transformer, sip_base):
         """run_once() returns False when no tokens are available."""
-        in_bucket, out_bucket = buckets
-        sip_base = tmp_path / "sips"
 
         f = HtmlFilter(
-            pipe=Pipe(in_bucket, out_bucket),
+            pipe=pipe,
             transformer=mock_transformer,
             sip_base=sip_base,
         )
@@ -198,213 +257,80 @@ class TestHtmlFilter:
 
 
 # ---------------------------------------------------------------------------
-# Tests: PdfFilter
+# Tests: SIPTransformerFilter subclasses (PDF, ALTO, MODS, Image)
 # ---------------------------------------------------------------------------
 
 
-class TestPdfFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "html_transform"
-        out_bucket = tmp_path / "pdf_transform"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_transformer(self):
-        t = MagicMock()
-        t.transform.return_value = _make_manifest()
-        return t
+@pytest.mark.usefixtures("empty_buckets")
+class TestSIPTransformerFilters:
+    """Shared run_once() behaviour of the four SIPTransformer-backed filters."""
 
-    def test_token_advances_to_output_bucket(self, buckets, mock_transformer):
+    @pytest.fixture(
+        scope="class",
+        params=[
+            (PdfFilter, "html_transform", "pdf_transform"),
+            (AltoFilter, "pdf_transform", "alto_transform"),
+            (ModsFilter, "alto_transform", "mods_transform"),
+            (ImageFilter, "mods_transform", "image_transform"),
+        ],
+        ids=["pdf", "alto", "mods", "image"],
+    )
+    @classmethod
+    def stage(cls, request):
+        return request.param
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def filter_cls(cls, stage):
+        return stage[0]
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def buckets(cls, fs_class, stage):
+        _, in_name, out_name = stage
+        return _make_buckets(in_name, out_name)
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_transformer(cls):
+        return _StubTransformer(return_value=_DEFAULT_MANIFEST)
+
+    def test_token_advances_to_output_bucket(self, filter_cls, buckets, pipe, mock_transformer):
         """run_once() moves token from input to output bucket."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        f = PdfFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
+        f = filter_cls(pipe=pipe, transformer=mock_transformer)
         assert f.run_once() is True
-        assert (out_bucket / "2026-01-29.json").exists()
+        assert _entries(out_bucket) == {"2026-01-29.json"}
 
-    def test_validation_error_on_missing_sip_path(self, buckets, mock_transformer):
+    def test_validation_error_on_missing_sip_path(
+        self, filter_cls, buckets, pipe, mock_transformer
+    ):
         """run_once() sends token to .err when sip_path is missing."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {})  # no sip_path
+        _seed_token_bytes(in_bucket, "2026-01-29", _EMPTY_TOKEN)  # no sip_path
 
-        f = PdfFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
+        f = filter_cls(pipe=pipe, transformer=mock_transformer)
         assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
 
-    def test_transformer_exception_sends_token_to_err(self, buckets):
+    def test_transformer_exception_sends_token_to_err(self, filter_cls, buckets, pipe):
         """run_once() routes token to .err when transformer raises."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        bad_transformer = MagicMock()
-        bad_transformer.transform.side_effect = RuntimeError("PDF failed")
+        error = RuntimeError(f"{filter_cls.__name__} failed")
+        bad_transformer = _StubTransformer(side_effect=error)
 
-        f = PdfFilter(pipe=Pipe(in_bucket, out_bucket), transformer=bad_transformer)
+        f = filter_cls(pipe=pipe, transformer=bad_transformer)
         assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
 
-    def test_no_tokens_returns_false(self, buckets, mock_transformer):
+    def test_no_tokens_returns_false(self, filter_cls, pipe, mock_transformer):
         """run_once() returns False when no tokens are available."""
-        in_bucket, out_bucket = buckets
-        f = PdfFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is False
-
-
-# ---------------------------------------------------------------------------
-# Tests: AltoFilter
-# ---------------------------------------------------------------------------
-
-
-class TestAltoFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "pdf_transform"
-        out_bucket = tmp_path / "alto_transform"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_transformer(self):
-        t = MagicMock()
-        t.transform.return_value = _make_manifest()
-        return t
-
-    def test_token_advances_to_output_bucket(self, buckets, mock_transformer):
-        """run_once() moves token from input to output bucket."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        f = AltoFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is True
-        assert (out_bucket / "2026-01-29.json").exists()
-
-    def test_validation_error_on_missing_sip_path(self, buckets, mock_transformer):
-        """run_once() sends token to .err when sip_path is missing."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {})
-
-        f = AltoFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
-
-    def test_transformer_exception_sends_token_to_err(self, buckets):
-        """run_once() routes token to .err when transformer raises."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        bad_transformer = MagicMock()
-        bad_transformer.transform.side_effect = RuntimeError("ALTO failed")
-
-        f = AltoFilter(pipe=Pipe(in_bucket, out_bucket), transformer=bad_transformer)
+        f = filter_cls(pipe=pipe, transformer=mock_transformer)
         assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
-
-
-# ---------------------------------------------------------------------------
-# Tests: ModsFilter
-# ---------------------------------------------------------------------------
-
-
-class TestModsFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "alto_transform"
-        out_bucket = tmp_path / "mods_transform"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_transformer(self):
-        t = MagicMock()
-        t.transform.return_value = _make_manifest()
-        return t
-
-    def test_token_advances_to_output_bucket(self, buckets, mock_transformer):
-        """run_once() moves token from input to output bucket."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        f = ModsFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is True
-        assert (out_bucket / "2026-01-29.json").exists()
-
-    def test_validation_error_on_missing_sip_path(self, buckets, mock_transformer):
-        """run_once() sends token to .err when sip_path is missing."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {})
-
-        f = ModsFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
-
-    def test_transformer_exception_sends_token_to_err(self, buckets):
-        """run_once() routes token to .err when transformer raises."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        bad_transformer = MagicMock()
-        bad_transformer.transform.side_effect = RuntimeError("MODS failed")
-
-        f = ModsFilter(pipe=Pipe(in_bucket, out_bucket), transformer=bad_transformer)
-        assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
-
-
-# ---------------------------------------------------------------------------
-# Tests: ImageFilter
-# ---------------------------------------------------------------------------
-
-
-class TestImageFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "mods_transform"
-        out_bucket = tmp_path / "image_transform"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_transformer(self):
-        t = MagicMock()
-        t.transform.return_value = _make_manifest()
-        return t
-
-    def test_token_advances_to_output_bucket(self, buckets, mock_transformer):
-        """run_once() moves token from input to output bucket."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        f = ImageFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is True
-        assert (out_bucket / "2026-01-29.json").exists()
-
-    def test_validation_error_on_missing_sip_path(self, buckets, mock_transformer):
-        """run_once() sends token to .err when sip_path is missing."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {})
-
-        f = ImageFilter(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
-        assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
-
-    def test_transformer_exception_sends_token_to_err(self, buckets):
-        """run_once() routes token to .err when transformer raises."""
-        in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
-
-        bad_transformer = MagicMock()
-        bad_transformer.transform.side_effect = RuntimeError("Image failed")
-
-        f = ImageFilter(pipe=Pipe(in_bucket, out_bucket), transformer=bad_transformer)
-        assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
 
 
 # ---------------------------------------------------------------------------
@@ -412,6 +338,7 @@ class TestImageFilter:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("empty_buckets")
 class TestSIPTransformerFilterValidationErrors:
     """Verify that all SIPTransformerFilter subclasses propagate validation_errors.
 
@@ -419,28 +346,32 @@ class TestSIPTransformerFilterValidationErrors:
     covers the four SIPTransformer-backed filters with a single parametrized test.
     """
 
-    @pytest.mark.parametrize("filter_cls", [PdfFilter, AltoFilter, ModsFilter, ImageFilter])
-    def test_validation_errors_stored_on_token(self, filter_cls, tmp_path):
-        """Manifest validation_errors are written to the token for all SIP filters."""
-        in_bucket = tmp_path / "in"
-        out_bucket = tmp_path / "out"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def buckets(cls, fs_class):
+        return _make_buckets("in", "out")
 
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+    @pytest.fixture(scope="class")
+    @classmethod
+    def errors_transformer(cls):
+        errors_manifest = _DEFAULT_MANIFEST.model_copy(
+            update={"validation_errors": ["Article 99: transform failed"]}
+        )
+        return _StubTransformer(return_value=errors_manifest)
 
-        manifest_with_errors = _make_manifest()
-        manifest_with_errors.validation_errors = ["Article 99: transform failed"]
+    @pytest.mark.parametrize("filter_cls", [PdfFilter, AltoFilter, ModsFilter, ImageFilter])
+    def test_validation_errors_stored_on_token(self, filter_cls, buckets, pipe, errors_transformer):
+        """Manifest validation_errors are written to the token for all SIP filters."""
+        in_bucket, out_bucket = buckets
 
-        mock_transformer = MagicMock()
-        mock_transformer.transform.return_value = manifest_with_errors
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        f = filter_cls(pipe=Pipe(in_bucket, out_bucket), transformer=mock_transformer)
+        f = filter_cls(pipe=pipe, transformer=errors_transformer)
         result = f.run_once()
 
         # Token still advances — validation_errors are non-fatal
         assert result is True
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert "validation_errors" in token_data
         assert "Article 99: transform failed" in token_data["validation_errors"]
 
@@ -450,79 +381,73 @@ class TestSIPTransformerFilterValidationErrors:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("empty_buckets")
 class TestMetsFilter:
-    @pytest.fixture
-    def buckets(self, tmp_path):
-        in_bucket = tmp_path / "image_transform"
-        out_bucket = tmp_path / "sip_complete"
-        in_bucket.mkdir()
-        out_bucket.mkdir()
-        return in_bucket, out_bucket
-
-    @pytest.fixture
-    def mock_compiler(self):
-        c = MagicMock()
-        sealed = _make_manifest(mets_path="mets.xml")
-        sealed.status = "sealed"
-        c.compile.return_value = sealed
-        return c
-
-    def test_token_advances_to_output_bucket(self, buckets, mock_compiler):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def buckets(cls, fs_class):
+        return _make_buckets("image_transform", "sip_complete")
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_compiler(cls):
+        sealed = _DEFAULT_MANIFEST.model_copy(update={"mets_path": "mets.xml", "status": "sealed"})
+        return _StubTransformer(return_value=sealed)
+
+    def test_token_advances_to_output_bucket(self, buckets, pipe, mock_compiler):
         """run_once() moves token from input to output bucket."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=mock_compiler)
+        f = MetsFilter(pipe=pipe, compiler=mock_compiler)
         assert f.run_once() is True
-        assert (out_bucket / "2026-01-29.json").exists()
+        assert _entries(out_bucket) == {"2026-01-29.json"}
 
-    def test_sets_mets_path_on_token(self, buckets, mock_compiler):
+    def test_sets_mets_path_on_token(self, buckets, pipe, mock_compiler):
         """run_once() sets mets_path prop on the token."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=mock_compiler)
+        f = MetsFilter(pipe=pipe, compiler=mock_compiler)
         f.run_once()
 
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert token_data["mets_path"] == "mets.xml"
 
-    def test_sets_status_on_token(self, buckets, mock_compiler):
+    def test_sets_status_on_token(self, buckets, pipe, mock_compiler):
         """run_once() sets status prop on the token."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=mock_compiler)
+        f = MetsFilter(pipe=pipe, compiler=mock_compiler)
         f.run_once()
 
-        token_data = json.loads((out_bucket / "2026-01-29.json").read_text())
+        token_data = _read_token(out_bucket / "2026-01-29.json")
         assert token_data["status"] == "sealed"
 
-    def test_validation_error_on_missing_sip_path(self, buckets, mock_compiler):
+    def test_validation_error_on_missing_sip_path(self, buckets, pipe, mock_compiler):
         """run_once() sends token to .err when sip_path is missing."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {})
+        _seed_token_bytes(in_bucket, "2026-01-29", _EMPTY_TOKEN)
 
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=mock_compiler)
+        f = MetsFilter(pipe=pipe, compiler=mock_compiler)
         assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
 
-    def test_compiler_exception_sends_token_to_err(self, buckets):
+    def test_compiler_exception_sends_token_to_err(self, buckets, pipe):
         """run_once() routes token to .err when compiler raises."""
         in_bucket, out_bucket = buckets
-        _seed_token(in_bucket, "2026-01-29", {"sip_path": "/some/sip"})
+        _seed_token_bytes(in_bucket, "2026-01-29", _SIP_PATH_TOKEN)
 
-        bad_compiler = MagicMock()
-        bad_compiler.compile.side_effect = RuntimeError("METS compile failed")
+        bad_compiler = _StubTransformer(side_effect=RuntimeError("METS compile failed"))
 
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=bad_compiler)
+        f = MetsFilter(pipe=pipe, compiler=bad_compiler)
         assert f.run_once() is False
-        assert (in_bucket / "2026-01-29.err").exists()
+        assert _entries(in_bucket) == {"2026-01-29.err"}
 
-    def test_no_tokens_returns_false(self, buckets, mock_compiler):
+    def test_no_tokens_returns_false(self, pipe, mock_compiler):
         """run_once() returns False when no tokens are available."""
-        in_bucket, out_bucket = buckets
-        f = MetsFilter(pipe=Pipe(in_bucket, out_bucket), compiler=mock_compiler)
+        f = MetsFilter(pipe=pipe, compiler=mock_compiler)
         assert f.run_once() is False
 
 
@@ -531,32 +456,55 @@ class TestMetsFilter:
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def minimal_pip(tmp_path, sample_ceo_record):
+@pytest.fixture(scope="module")
+def minimal_pip(tmp_path_factory, sample_ceo_record_bytes):
     """Minimal PIP fixture for Orchestrator integration test."""
-    pip_dir = tmp_path / "pips" / "2026-01-29"
+    pip_dir = tmp_path_factory.mktemp("pips") / "2026-01-29"
     article_dir = pip_dir / "articles" / "12345"
     article_dir.mkdir(parents=True)
-    (article_dir / "ceo_record.json").write_text(json.dumps(sample_ceo_record))
+    (article_dir / "ceo_record.json").write_bytes(sample_ceo_record_bytes)
 
-    pip_manifest = PIPManifest(
+    pip_manifest = PIPManifest.model_construct(
         id="2026-01-29",
         title="The Daily Princetonian",
         date_range=("2026-01-29", "2026-01-29"),
         articles=[
-            PIPArticle(
+            PIPArticle.model_construct(
                 ceo_id="12345",
                 ceo_record_path="articles/12345/ceo_record.json",
             )
         ],
     )
-    (pip_dir / "pip-manifest.json").write_text(pip_manifest.model_dump_json(indent=2))
+    (pip_dir / "pip-manifest.json").write_bytes(pip_manifest.model_dump_json().encode())
     return pip_dir
 
 
 class TestOrchestrator:
+    """Integration tests for the Orchestrator.
+
+    Orchestrator is imported inside the tests because it loads every
+    transformer, which the filter tests above do not need at collection.
+    """
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def ran_orchestrator(cls, tmp_path_factory, minimal_pip):
+        """Run the Orchestrator over minimal_pip once; returns (token, workspace, sip_output).
+
+        Only for read-only assertions on the run's results.
+        """
+        from periodical_distiller.pipeline.orchestrator import Orchestrator
+
+        base = tmp_path_factory.mktemp("orchestrator")
+        workspace = base / "workspace"
+        sip_output = base / "sips"
+        token = Orchestrator(workspace=workspace, sip_output=sip_output).run(minimal_pip)
+        return token, workspace, sip_output
+
     def test_instantiation(self, tmp_path):
         """Orchestrator can be instantiated with workspace and sip_output."""
+        from periodical_distiller.pipeline.orchestrator import Orchestrator
+
         workspace = tmp_path / "workspace"
         sip_output = tmp_path / "sips"
         orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
@@ -564,7 +512,7 @@ class TestOrchestrator:
 
     def test_creates_all_bucket_dirs(self, tmp_path):
         """Orchestrator creates all BUCKET_NAMES directories under workspace."""
-        from periodical_distiller.pipeline.orchestrator import BUCKET_NAMES
+        from periodical_distiller.pipeline.orchestrator import BUCKET_NAMES, Orchestrator
 
         workspace = tmp_path / "workspace"
         sip_output = tmp_path / "sips"
@@ -572,46 +520,31 @@ class TestOrchestrator:
         for name in BUCKET_NAMES:
             assert (workspace / name).is_dir(), f"Bucket dir missing: {name}"
 
-    def test_run_returns_token(self, tmp_path, minimal_pip):
+    def test_run_returns_token(self, ran_orchestrator):
         """Orchestrator.run() returns a Token after processing."""
-        workspace = tmp_path / "workspace"
-        sip_output = tmp_path / "sips"
-        orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
-        token = orchestrator.run(minimal_pip)
+        token, _, _ = ran_orchestrator
         assert isinstance(token, Token)
 
-    def test_run_produces_sealed_sip(self, tmp_path, minimal_pip):
+    def test_run_produces_sealed_sip(self, ran_orchestrator):
         """Orchestrator.run() produces a sealed SIP with status='sealed'."""
-        workspace = tmp_path / "workspace"
-        sip_output = tmp_path / "sips"
-        orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
-        token = orchestrator.run(minimal_pip)
+        token, _, _ = ran_orchestrator
         assert token.get_prop("status") == "sealed"
 
-    def test_run_produces_mets_xml(self, tmp_path, minimal_pip):
+    def test_run_produces_mets_xml(self, ran_orchestrator):
         """Orchestrator.run() produces a mets.xml file in the SIP."""
-        workspace = tmp_path / "workspace"
-        sip_output = tmp_path / "sips"
-        orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
-        orchestrator.run(minimal_pip)
+        _, _, sip_output = ran_orchestrator
         sip_path = sip_output / "2026-01-29"
         assert (sip_path / "mets.xml").exists()
 
-    def test_run_token_in_sip_complete_bucket(self, tmp_path, minimal_pip):
+    def test_run_token_in_sip_complete_bucket(self, ran_orchestrator):
         """After Orchestrator.run(), token JSON is in sip_complete bucket."""
-        workspace = tmp_path / "workspace"
-        sip_output = tmp_path / "sips"
-        orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
-        orchestrator.run(minimal_pip)
+        _, workspace, _ = ran_orchestrator
         sip_complete = workspace / "sip_complete"
         assert (sip_complete / "2026-01-29.json").exists()
 
-    def test_run_sets_sip_path_on_token(self, tmp_path, minimal_pip):
+    def test_run_sets_sip_path_on_token(self, ran_orchestrator):
         """Orchestrator.run() sets sip_path prop on the returned token."""
-        workspace = tmp_path / "workspace"
-        sip_output = tmp_path / "sips"
-        orchestrator = Orchestrator(workspace=workspace, sip_output=sip_output)
-        token = orchestrator.run(minimal_pip)
+        token, _, _ = ran_orchestrator
         sip_path = token.get_prop("sip_path")
         assert sip_path is not None
         assert "2026-01-29" in sip_path
@@ -1,11 +1,39 @@
 """Tests for pipeline infrastructure."""
 
 import json
+import os
 
 import pytest
 
 from periodical_distiller.pipeline import Filter, Pipe, Pipeline, Token, dump_token, load_token
 
+_EMPTY_TOKEN = b"{}"
+
+
+def _token_bytes(content: dict) -> bytes:
+    """Serialize token content as compact JSON for writing into a bucket."""
+    return json.dumps(content).encode()
+
+
+@pytest.fixture(scope="module")
+def bucket_dirs(tmp_path_factory):
+    """Input and output bucket directories shared by the module's tests."""
+    root = tmp_path_factory.mktemp("buckets")
+    in_path, out_path = root / "input", root / "output"
+    in_path.mkdir()
+    out_path.mkdir()
+    return in_path, out_path
+
+
+@pytest.fixture
+def buckets(bucket_dirs):
+    """Empty (input, output) bucket pair, cleared again after the test."""
+    yield bucket_dirs
+    for bucket in bucket_dirs:
+        with os.scandir(bucket) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+
 
 class TestToken:
     """Tests for Token class."""
@@ -26,6 +54,12 @@ class TestToken:
         token = Token({"other": "data"})
         assert token.name is None
 
+    def test_token_name_follows_id_changes(self):
+        """Token.name reflects an id set after construction."""
+        token = Token({"id": "draft"})
+        token.put_prop("id", "final")
+        assert token.name == "final"
+
     def test_token_get_prop(self):
         """Token.get_prop retrieves properties."""
         token = Token({"id": "123", "status": "pending"})
@@ -38,6 +72,27 @@ class TestToken:
         token.put_prop("html_path", "/path/to/file.html")
         assert token.get_prop("html_path") == "/path/to/file.html"
 
+    def test_token_item_access(self):
+        """Token supports subscript access to its content."""
+        token = Token({"id": "123"})
+        token["html_path"] = "/path/to/file.html"
+        assert token["html_path"] == "/path/to/file.html"
+        assert token.content["html_path"] == "/path/to/file.html"
+
+    def test_token_item_access_missing_key_raises(self):
+        """Subscripting a missing property raises KeyError, unlike get_prop."""
+        token = Token({"id": "123"})
+        with pytest.raises(KeyError):
+            token["missing"]
+
+    def test_token_membership(self):
+        """`in` checks token content keys; iterating a token is a TypeError."""
+        token = Token({"id": "123"})
+        assert "id" in token
+        assert "missing" not in token
+        with pytest.raises(TypeError):
+            list(token)
+
     def test_token_repr(self):
         """Token repr includes the name."""
         token = Token({"id": "test-123"})
@@ -70,37 +125,61 @@ class TestToken:
 class TestLoadDumpToken:
     """Tests for token serialization."""
 
-    def test_load_token(self, tmp_path):
+    def test_load_token(self, buckets):
         """load_token reads token from JSON file."""
-        token_file = tmp_path / "test.json"
-        token_file.write_text(json.dumps({"id": "123", "data": "test"}))
+        in_path, _ = buckets
+        token_file = in_path / "test.json"
+        token_file.write_bytes(_token_bytes({"id": "123", "data": "test"}))
 
         token = load_token(token_file)
         assert token.name == "123"
         assert token.get_prop("data") == "test"
 
-    def test_dump_token(self, tmp_path):
+    def test_dump_token(self, buckets):
         """dump_token writes token to JSON file."""
+        _, out_path = buckets
         token = Token({"id": "456", "status": "complete"})
-        dest = tmp_path / "output.json"
+        dest = out_path / "output.json"
 
         dump_token(token, dest)
 
         assert dest.exists()
-        data = json.loads(dest.read_text())
+        data = json.loads(dest.read_bytes())
         assert data["id"] == "456"
         assert data["status"] == "complete"
 
+    def test_dump_token_replaces_existing_file(self, buckets):
+        """dump_token overwrites an existing file and leaves no temporary behind."""
+        _, out_path = buckets
+        dest = out_path / "output.json"
+        dest.write_bytes(_token_bytes({"id": "456", "status": "pending"}))
+
+        dump_token(Token({"id": "456", "status": "complete"}), dest)
+
+        assert json.loads(dest.read_bytes())["status"] == "complete"
+        assert os.listdir(out_path) == ["output.json"]
+
+    def test_dump_token_removes_temporary_on_failure(self, buckets, monkeypatch):
+        """dump_token cleans up its temporary file when publishing fails."""
+        _, out_path = buckets
+
+        def fail_replace(src, dst):
+            raise OSError("simulated failure")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+
+        with pytest.raises(OSError, match="simulated failure"):
+            dump_token(Token({"id": "456"}), out_path / "output.json")
+
+        assert os.listdir(out_path) == []
+
 
 class TestPipe:
     """Tests for Pipe class."""
 
-    def test_pipe_creation(self, tmp_path):
+    def test_pipe_creation(self, buckets):
         """Pipe can be created with input/output paths."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         pipe = Pipe(in_path, out_path)
         assert pipe.input == in_path
@@ -113,16 +192,13 @@ class TestPipe:
         assert "in" in repr(pipe)
         assert "out" in repr(pipe)
 
-    def test_pipe_list_input_tokens(self, tmp_path):
+    def test_pipe_list_input_tokens(self, buckets):
         """Pipe.list_input_tokens returns all tokens in input bucket."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         # Create some token files
-        (in_path / "token1.json").write_text(json.dumps({"id": "token1"}))
-        (in_path / "token2.json").write_text(json.dumps({"id": "token2"}))
+        (in_path / "token1.json").write_bytes(_token_bytes({"id": "token1"}))
+        (in_path / "token2.json").write_bytes(_token_bytes({"id": "token2"}))
 
         pipe = Pipe(in_path, out_path)
         tokens = pipe.list_input_tokens()
@@ -131,14 +207,11 @@ class TestPipe:
         names = {t.name for t in tokens}
         assert names == {"token1", "token2"}
 
-    def test_pipe_take_token(self, tmp_path):
+    def test_pipe_take_token(self, buckets):
         """Pipe.take_token gets and marks a token."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "article.json").write_text(json.dumps({"id": "article"}))
+        (in_path / "article.json").write_bytes(_token_bytes({"id": "article"}))
 
         pipe = Pipe(in_path, out_path)
         token = pipe.take_token()
@@ -150,41 +223,44 @@ class TestPipe:
         assert not (in_path / "article.json").exists()
         assert (in_path / "article.bak").exists()
 
-    def test_pipe_take_token_by_id(self, tmp_path):
+    def test_pipe_take_token_by_id(self, buckets):
         """Pipe.take_token can take a specific token by id."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "first.json").write_text(json.dumps({"id": "first"}))
-        (in_path / "second.json").write_text(json.dumps({"id": "second"}))
+        (in_path / "first.json").write_bytes(_token_bytes({"id": "first"}))
+        (in_path / "second.json").write_bytes(_token_bytes({"id": "second"}))
 
         pipe = Pipe(in_path, out_path)
         token = pipe.take_token(id="second")
 
         assert token.name == "second"
 
-    def test_pipe_take_token_returns_none_when_empty(self, tmp_path):
+    def test_pipe_take_token_with_dotted_id(self, buckets):
+        """Pipe keeps the whole token id when building bucket file names."""
+        in_path, out_path = buckets
+
+        (in_path / "v1.2.json").write_bytes(_token_bytes({"id": "v1.2"}))
+
+        pipe = Pipe(in_path, out_path)
+        token = pipe.take_token(id="v1.2")
+
+        assert token.name == "v1.2"
+        assert (in_path / "v1.2.bak").exists()
+
+    def test_pipe_take_token_returns_none_when_empty(self, buckets):
         """Pipe.take_token returns None when no tokens available."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         pipe = Pipe(in_path, out_path)
         token = pipe.take_token()
 
         assert token is None
 
-    def test_pipe_put_token(self, tmp_path):
+    def test_pipe_put_token(self, buckets):
         """Pipe.put_token moves token to output bucket."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "article.json").write_text(json.dumps({"id": "article"}))
+        (in_path / "article.json").write_bytes(_token_bytes({"id": "article"}))
 
         pipe = Pipe(in_path, out_path)
         pipe.take_token()
@@ -196,14 +272,11 @@ class TestPipe:
         assert (out_path / "article.json").exists()
         assert pipe.token is None
 
-    def test_pipe_put_token_with_error(self, tmp_path):
+    def test_pipe_put_token_with_error(self, buckets):
         """Pipe.put_token with error_flag creates .err file."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "article.json").write_text(json.dumps({"id": "article"}))
+        (in_path / "article.json").write_bytes(_token_bytes({"id": "article"}))
 
         pipe = Pipe(in_path, out_path)
         pipe.take_token()
@@ -213,14 +286,11 @@ class TestPipe:
         assert (in_path / "article.err").exists()
         assert not (out_path / "article.json").exists()
 
-    def test_pipe_put_token_back(self, tmp_path):
+    def test_pipe_put_token_back(self, buckets):
         """Pipe.put_token_back returns token to input bucket."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "article.json").write_text(json.dumps({"id": "article"}))
+        (in_path / "article.json").write_bytes(_token_bytes({"id": "article"}))
 
         pipe = Pipe(in_path, out_path)
         pipe.take_token()
@@ -234,12 +304,9 @@ class TestPipe:
 class TestFilter:
     """Tests for Filter base class."""
 
-    def test_filter_requires_implementation(self, tmp_path):
+    def test_filter_requires_implementation(self, buckets):
         """Filter subclass missing abstract methods cannot be instantiated."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         pipe = Pipe(in_path, out_path)
 
@@ -252,15 +319,12 @@ class TestFilter:
         with pytest.raises(TypeError):
             IncompleteFilter(pipe)
 
-    def test_filter_recovers_orphaned_tokens(self, tmp_path):
+    def test_filter_recovers_orphaned_tokens(self, buckets):
         """Filter recovers .bak files on startup."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         # Create an orphaned .bak file
-        (in_path / "orphan.bak").write_text(json.dumps({"id": "orphan"}))
+        (in_path / "orphan.bak").write_bytes(_token_bytes({"id": "orphan"}))
 
         pipe = Pipe(in_path, out_path)
 
@@ -278,14 +342,11 @@ class TestFilter:
         assert (in_path / "orphan.json").exists()
         assert not (in_path / "orphan.bak").exists()
 
-    def test_filter_run_once_processes_token(self, tmp_path):
+    def test_filter_run_once_processes_token(self, buckets):
         """Filter.run_once processes a single token."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "test.json").write_text(json.dumps({"id": "test"}))
+        (in_path / "test.json").write_bytes(_token_bytes({"id": "test"}))
 
         pipe = Pipe(in_path, out_path)
 
@@ -304,15 +365,12 @@ class TestFilter:
         assert (out_path / "test.json").exists()
 
         # Verify the processed flag was set
-        data = json.loads((out_path / "test.json").read_text())
+        data = json.loads((out_path / "test.json").read_bytes())
         assert data["processed"] is True
 
-    def test_filter_run_once_returns_false_when_no_tokens(self, tmp_path):
+    def test_filter_run_once_returns_false_when_no_tokens(self, buckets):
         """Filter.run_once returns False when no tokens available."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
         pipe = Pipe(in_path, out_path)
 
@@ -328,14 +386,11 @@ class TestFilter:
 
         assert result is False
 
-    def test_filter_moves_invalid_token_to_error(self, tmp_path):
+    def test_filter_moves_invalid_token_to_error(self, buckets):
         """Filter moves tokens that fail validation to .err."""
-        in_path = tmp_path / "input"
-        out_path = tmp_path / "output"
-        in_path.mkdir()
-        out_path.mkdir()
+        in_path, out_path = buckets
 
-        (in_path / "invalid.json").write_text(json.dumps({"id": "invalid"}))
+        (in_path / "invalid.json").write_bytes(_token_bytes({"id": "invalid"}))
 
         pipe = Pipe(in_path, out_path)
 
@@ -361,11 +416,10 @@ class TestPipeline:
         pipeline = Pipeline()
         assert pipeline.buckets == {}
 
-    def test_pipeline_add_bucket(self, tmp_path):
+    def test_pipeline_add_bucket(self, buckets):
         """Pipeline.add_bucket adds a bucket."""
         pipeline = Pipeline()
-        bucket_path = tmp_path / "bucket"
-        bucket_path.mkdir()
+        bucket_path, _ = buckets
 
         pipeline.add_bucket("test", bucket_path)
 
@@ -379,12 +433,9 @@ class TestPipeline:
         with pytest.raises(ValueError, match="no such bucket"):
             pipeline.bucket("nonexistent")
 
-    def test_pipeline_from_config(self, tmp_path):
+    def test_pipeline_from_config(self, buckets):
         """Pipeline can be created from config dict."""
-        bucket1 = tmp_path / "bucket1"
-        bucket2 = tmp_path / "bucket2"
-        bucket1.mkdir()
-        bucket2.mkdir()
+        bucket1, bucket2 = buckets
 
         config = {
             "buckets": [
@@ -398,12 +449,9 @@ class TestPipeline:
         assert pipeline.bucket("input") == bucket1
         assert pipeline.bucket("output") == bucket2
 
-    def test_pipeline_pipe(self, tmp_path):
+    def test_pipeline_pipe(self, buckets):
         """Pipeline.pipe creates a Pipe between buckets."""
-        bucket1 = tmp_path / "bucket1"
-        bucket2 = tmp_path / "bucket2"
-        bucket1.mkdir()
-        bucket2.mkdir()
+        bucket1, bucket2 = buckets
 
         pipeline = Pipeline()
         pipeline.add_bucket("in", bucket1)
@@ -415,14 +463,13 @@ class TestPipeline:
         assert pipe.input == bucket1
         assert pipe.output == bucket2
 
-    def test_pipeline_snapshot(self, tmp_path):
+    def test_pipeline_snapshot(self, buckets):
         """Pipeline.snapshot shows bucket status."""
-        bucket = tmp_path / "bucket"
-        bucket.mkdir()
+        bucket, _ = buckets
 
-        (bucket / "waiting.json").write_text("{}")
-        (bucket / "error.err").write_text("{}")
-        (bucket / "processing.bak").write_text("{}")
+        (bucket / "waiting.json").write_bytes(_EMPTY_TOKEN)
+        (bucket / "error.err").write_bytes(_EMPTY_TOKEN)
+        (bucket / "processing.bak").write_bytes(_EMPTY_TOKEN)
 
         pipeline = Pipeline()
         pipeline.add_bucket("test", bucket)
@@ -433,3 +480,20 @@ class TestPipeline:
         assert "waiting.json" in snapshot["test"]["waiting_tokens"]
         assert "error.err" in snapshot["test"]["errored_tokens"]
         assert "processing.bak" in snapshot["test"]["in_process_tokens"]
+
+    def test_pipeline_snapshot_multiple_buckets(self, tmp_path):
+        """Pipeline.snapshot reports every bucket under its own name."""
+        pipeline = Pipeline()
+        for name in ("first", "second", "third"):
+            bucket = tmp_path / name
+            bucket.mkdir()
+            (bucket / f"{name}.json").write_bytes(_EMPTY_TOKEN)
+            pipeline.add_bucket(name, bucket)
+
+        snapshot = pipeline.snapshot
+
+        assert list(snapshot) == ["first", "second", "third"]
+        for name in ("first", "second", "third"):
+            assert snapshot[name]["waiting_tokens"] == [f"{name}.json"]
+            assert snapshot[name]["errored_tokens"] == []
+            assert snapshot[name]["in_process_tokens"] == []
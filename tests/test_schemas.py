@@ -21,6 +21,20 @@ from schemas import (
 )
 from schemas.tokens import ArticleTokenContent, IssueTokenContent
 
+_ISSUE_DATE = date(2026, 1, 15)
+_ISSUE_DATE_RANGE = (_ISSUE_DATE, _ISSUE_DATE)
+_ALTO_PATH = Path("/path/to/001.xml")
+_IMAGE_PATH = Path("/path/to/001.png")
+
+
+@pytest.fixture(scope="module")
+def pip_article():
+    """Minimal PIPArticle shared by tests that only read it."""
+    return PIPArticle(
+        ceo_id="12345",
+        ceo_record_path="articles/12345/ceo_record.json",
+    )
+
 
 class TestArticle:
     """Tests for Article dataclass."""
@@ -37,12 +51,14 @@ class TestArticle:
         assert article.page_count == 0
         assert article.alto_paths == []
         assert article.mods is None
+        assert not hasattr(article, "__dict__")  # slotted dataclass
 
-    def test_article_with_all_fields(self, tmp_path):
+    def test_article_with_all_fields(self):
         """Article can be created with all fields."""
-        html_path = tmp_path / "article.html"
-        pdf_path = tmp_path / "article.pdf"
-        alto_paths = [tmp_path / "001.xml", tmp_path / "002.xml"]
+        article_dir = Path("/path/to/articles/12345")
+        html_path = article_dir / "article.html"
+        pdf_path = article_dir / "article.pdf"
+        alto_paths = [article_dir / "001.xml", article_dir / "002.xml"]
 
         article = Article(
             ceo_id="12345",
@@ -57,7 +73,7 @@ class TestArticle:
         assert article.html_path == html_path
         assert article.pdf_path == pdf_path
         assert article.page_count == 2
-        assert len(article.alto_paths) == 2
+        assert article.alto_paths == alto_paths
 
 
 class TestIssue:
@@ -67,26 +83,26 @@ class TestIssue:
         """Issue can be created with required fields."""
         issue = Issue(
             issue_id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="The Daily Princetonian - January 15, 2026",
         )
 
         assert issue.issue_id == "2026-01-15"
-        assert issue.date_range == (date(2026, 1, 15), date(2026, 1, 15))
+        assert issue.date_range == _ISSUE_DATE_RANGE
         assert issue.title == "The Daily Princetonian - January 15, 2026"
         assert issue.article_ids == []
+        assert not hasattr(issue, "__dict__")  # slotted dataclass
 
     def test_issue_with_articles(self):
         """Issue can track article IDs."""
         issue = Issue(
             issue_id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
             article_ids=["article1", "article2", "article3"],
         )
 
-        assert len(issue.article_ids) == 3
-        assert "article2" in issue.article_ids
+        assert issue.article_ids == ["article1", "article2", "article3"]
 
 
 class TestPage:
@@ -97,24 +113,25 @@ class TestPage:
         page = Page(
             page_number=1,
             article_id="article-123",
-            alto_path=Path("/path/to/001.xml"),
+            alto_path=_ALTO_PATH,
         )
 
         assert page.page_number == 1
         assert page.article_id == "article-123"
-        assert page.alto_path == Path("/path/to/001.xml")
+        assert page.alto_path == _ALTO_PATH
         assert page.image_path is None
+        assert not hasattr(page, "__dict__")  # slotted dataclass
 
     def test_page_with_image(self):
         """Page can include image path."""
         page = Page(
             page_number=1,
             article_id="article-123",
-            alto_path=Path("/path/to/001.xml"),
-            image_path=Path("/path/to/001.png"),
+            alto_path=_ALTO_PATH,
+            image_path=_IMAGE_PATH,
         )
 
-        assert page.image_path == Path("/path/to/001.png")
+        assert page.image_path == _IMAGE_PATH
 
 
 class TestArticleTokenContent:
@@ -152,8 +169,7 @@ class TestArticleTokenContent:
             log=[{"message": "test"}],
         )
 
-        # Extra fields should be accessible
-        assert hasattr(token, "log") or "log" in token.model_extra
+        assert token.model_extra.get("log") == [{"message": "test"}]
 
     def test_article_token_serialization(self):
         """ArticleTokenContent can be serialized to dict."""
@@ -170,6 +186,19 @@ class TestArticleTokenContent:
         assert data["html_path"] == "/path/to/file.html"
         assert data["page_count"] == 3
 
+    def test_article_token_json_round_trip(self):
+        """ArticleTokenContent round-trips through JSON bytes."""
+        token = ArticleTokenContent(
+            id="12345",
+            issue_id="2026-01-15",
+            html_path="/path/to/file.html",
+            page_count=3,
+        )
+
+        restored = ArticleTokenContent.model_validate_json(token.model_dump_json())
+
+        assert restored == token
+
     def test_article_token_validation(self):
         """ArticleTokenContent validates required fields."""
         with pytest.raises(ValidationError):
@@ -183,12 +212,12 @@ class TestIssueTokenContent:
         """IssueTokenContent can be created with required fields."""
         token = IssueTokenContent(
             id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
         )
 
         assert token.id == "2026-01-15"
-        assert token.date_range == (date(2026, 1, 15), date(2026, 1, 15))
+        assert token.date_range == _ISSUE_DATE_RANGE
         assert token.title == "Test Issue"
         assert token.article_ids == []
         assert token.articles == []
@@ -199,7 +228,7 @@ class TestIssueTokenContent:
         """IssueTokenContent can track articles."""
         token = IssueTokenContent(
             id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
             article_ids=["a1", "a2", "a3"],
             articles=[
@@ -208,14 +237,14 @@ class TestIssueTokenContent:
             ],
         )
 
-        assert len(token.article_ids) == 3
-        assert len(token.articles) == 2
+        assert token.article_ids == ["a1", "a2", "a3"]
+        assert [article["id"] for article in token.articles] == ["a1", "a2"]
 
     def test_issue_token_validation_errors(self):
         """IssueTokenContent can track validation errors."""
         token = IssueTokenContent(
             id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
             validation_errors=[
                 "ALTO file 001.xml failed schema validation",
@@ -223,13 +252,16 @@ class TestIssueTokenContent:
             ],
         )
 
-        assert len(token.validation_errors) == 2
+        assert token.validation_errors == [
+            "ALTO file 001.xml failed schema validation",
+            "MODS missing required field: title",
+        ]
 
     def test_issue_token_serialization(self):
         """IssueTokenContent can be serialized to dict."""
         token = IssueTokenContent(
             id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
             mets_path="/path/to/mets.xml",
         )
@@ -239,13 +271,27 @@ class TestIssueTokenContent:
         assert data["id"] == "2026-01-15"
         assert data["mets_path"] == "/path/to/mets.xml"
         # date_range should serialize to dates
-        assert data["date_range"] == (date(2026, 1, 15), date(2026, 1, 15))
+        assert data["date_range"] == _ISSUE_DATE_RANGE
+
+    def test_issue_token_json_round_trip(self):
+        """IssueTokenContent round-trips through JSON bytes, restoring dates."""
+        token = IssueTokenContent(
+            id="2026-01-15",
+            date_range=_ISSUE_DATE_RANGE,
+            title="Test Issue",
+            mets_path="/path/to/mets.xml",
+        )
+
+        restored = IssueTokenContent.model_validate_json(token.model_dump_json())
+
+        assert restored == token
+        assert restored.date_range == _ISSUE_DATE_RANGE
 
     def test_issue_token_with_pip_sip_paths(self):
         """IssueTokenContent can include pip_path and sip_path."""
         token = IssueTokenContent(
             id="2026-01-15",
-            date_range=(date(2026, 1, 15), date(2026, 1, 15)),
+            date_range=_ISSUE_DATE_RANGE,
             title="Test Issue",
             pip_path="/workspace/pips/2026-01-15",
             sip_path="/workspace/sips/2026-01-15",
@@ -274,29 +320,23 @@ class TestArticleTokenWithPackagePaths:
 class TestPIPMedia:
     """Tests for PIPMedia schema."""
 
-    def test_pip_media_creation(self):
-        """PIPMedia can be created with required fields."""
+    @pytest.mark.parametrize(
+        "optional",
+        [{}, {"media_type": "image/jpeg", "checksum": "abc123def456"}],
+        ids=["required-only", "all-fields"],
+    )
+    def test_pip_media_fields(self, optional):
+        """PIPMedia keeps required fields and defaults any optional field not given."""
         media = PIPMedia(
             original_url="https://example.com/image.jpg",
             local_path="articles/12345/images/image.jpg",
+            **optional,
         )
 
         assert media.original_url == "https://example.com/image.jpg"
         assert media.local_path == "articles/12345/images/image.jpg"
-        assert media.media_type is None
-        assert media.checksum is None
-
-    def test_pip_media_with_all_fields(self):
-        """PIPMedia can include optional fields."""
-        media = PIPMedia(
-            original_url="https://example.com/image.jpg",
-            local_path="articles/12345/images/image.jpg",
-            media_type="image/jpeg",
-            checksum="abc123def456",
-        )
-
-        assert media.media_type == "image/jpeg"
-        assert media.checksum == "abc123def456"
+        assert media.media_type == optional.get("media_type")
+        assert media.checksum == optional.get("checksum")
 
 
 class TestPIPArticle:
@@ -325,8 +365,7 @@ class TestPIPArticle:
             media=[media],
         )
 
-        assert len(article.media) == 1
-        assert article.media[0].original_url == "https://example.com/image.jpg"
+        assert article.media == [media]
 
 
 class TestPreservationDescriptionInfo:
@@ -377,36 +416,26 @@ class TestPIPManifest:
         assert manifest.status == "building"
         assert manifest.pdi.source_system == "CEO3"
 
-    def test_pip_manifest_with_articles(self):
+    def test_pip_manifest_with_articles(self, pip_article):
         """PIPManifest can include articles."""
-        article = PIPArticle(
-            ceo_id="12345",
-            ceo_record_path="articles/12345/ceo_record.json",
-        )
         manifest = PIPManifest(
             id="2026-01-15",
             title="Test Issue",
             date_range=("2026-01-15", "2026-01-15"),
-            articles=[article],
+            articles=[pip_article],
             status="sealed",
         )
 
-        assert len(manifest.articles) == 1
-        assert manifest.articles[0].ceo_id == "12345"
+        assert manifest.articles == [pip_article]
         assert manifest.status == "sealed"
 
-    def test_pip_manifest_json_serialization(self):
+    def test_pip_manifest_json_serialization(self, pip_article):
         """PIPManifest can be serialized to and from JSON."""
         manifest = PIPManifest(
             id="2026-01-15",
             title="Test Issue",
             date_range=("2026-01-15", "2026-01-15"),
-            articles=[
-                PIPArticle(
-                    ceo_id="12345",
-                    ceo_record_path="articles/12345/ceo_record.json",
-                )
-            ],
+            articles=[pip_article],
         )
 
         # Serialize to JSON
@@ -415,7 +444,7 @@ class TestPIPManifest:
 
         assert data["id"] == "2026-01-15"
         assert data["version"] == "1.0"
-        assert len(data["articles"]) == 1
+        assert [article["ceo_id"] for article in data["articles"]] == ["12345"]
 
         # Deserialize from JSON
         restored = PIPManifest.model_validate_json(json_str)
@@ -426,26 +455,18 @@ class TestPIPManifest:
 class TestSIPPage:
     """Tests for SIPPage schema."""
 
-    def test_sip_page_creation(self):
-        """SIPPage can be created with required fields."""
-        page = SIPPage(
-            page_number=1,
-            alto_path="articles/12345/001.alto.xml",
-        )
+    @pytest.mark.parametrize(
+        "optional",
+        [{}, {"image_path": "articles/12345/001.png"}],
+        ids=["required-only", "with-image"],
+    )
+    def test_sip_page_fields(self, optional):
+        """SIPPage keeps required fields and an optional image path."""
+        page = SIPPage(page_number=1, alto_path="articles/12345/001.alto.xml", **optional)
 
         assert page.page_number == 1
         assert page.alto_path == "articles/12345/001.alto.xml"
-        assert page.image_path is None
-
-    def test_sip_page_with_image(self):
-        """SIPPage can include image path."""
-        page = SIPPage(
-            page_number=1,
-            alto_path="articles/12345/001.alto.xml",
-            image_path="articles/12345/001.png",
-        )
-
-        assert page.image_path == "articles/12345/001.png"
+        assert page.image_path == optional.get("image_path")
 
 
 class TestSIPArticle:
@@ -478,7 +499,7 @@ class TestSIPArticle:
         assert article.html_path == "articles/12345/article.html"
         assert article.pdf_path == "articles/12345/article.pdf"
         assert article.mods_path == "articles/12345/article.mods.xml"
-        assert len(article.pages) == 2
+        assert article.pages == pages
 
 
 class TestSIPManifest:
@@ -517,7 +538,7 @@ class TestSIPManifest:
         )
 
         assert manifest.pip_path == "/workspace/pips/2026-01-15"
-        assert len(manifest.articles) == 1
+        assert manifest.articles == [article]
         assert manifest.mets_path == "mets.xml"
         assert manifest.status == "sealed"
 
@@ -532,7 +553,10 @@ class TestSIPManifest:
             ],
         )
 
-        assert len(manifest.validation_errors) == 2
+        assert manifest.validation_errors == [
+            "ALTO file 001.xml failed schema validation",
+            "Missing required MODS field: title",
+        ]
 
     def test_sip_manifest_json_serialization(self):
         """SIPManifest can be serialized to and from JSON."""
@@ -558,7 +582,7 @@ class TestSIPManifest:
         assert data["id"] == "2026-01-15"
         assert data["pip_id"] == "2026-01-15"
         assert data["status"] == "sealed"
-        assert len(data["articles"]) == 1
+        assert [article["ceo_id"] for article in data["articles"]] == ["12345"]
 
         # Deserialize from JSON
         restored = SIPManifest.model_validate_json(json_str)